@@ -129,16 +129,32 @@ class CheckableEventParentListModel(qc.QAbstractListModel):
         for event in events:
             if isinstance(event.data, SwitchEvent):
                 for case, target in event.data.cases.items():
-                    if target.v == child_event:
+                    if target.v is child_event:
                         self.entries.append((event, case))
             elif isinstance(event.data, ForkEvent):
                 for fork in event.data.forks:
-                    if fork.v == child_event:
+                    if fork.v is child_event:
                         self.entries.append((event, fork))
             else:
                 self.entries.append((event, None))
 
         self.is_selected = [True] * len(self.entries)
+        # Events with several matching branches share one description
+        descriptions: typing.Dict[int, str] = dict()
+        self.labels: typing.List[str] = []
+        for event, branch in self.entries:
+            description = descriptions.get(id(event))
+            if description is None:
+                description = util.get_event_full_description(event)
+                descriptions[id(event)] = description
+            self.labels.append(self.getEntryLabel(description, branch))
+
+    def getEntryLabel(self, description: str, branch: typing.Any) -> str:
+        if branch is None:
+            return description
+        if isinstance(branch, int):
+            return description + f' - Case {branch}'
+        return description + f' - Branch: {branch.v.name}'
 
     def getSelectedEvents(self) -> typing.List[typing.Tuple[Event, typing.List[typing.Any]]]:
         d: typing.DefaultDict[Event, typing.List[typing.Any]] = defaultdict(list)
@@ -175,14 +191,7 @@ class CheckableEventParentListModel(qc.QAbstractListModel):
     def data(self, index: qc.QModelIndex, role) -> qc.QVariant:
         row = index.row()
         if role == qc.Qt.DisplayRole or role == qc.Qt.ToolTipRole:
-            description = util.get_event_full_description(self.entries[row][0])
-            branch = self.entries[row][1]
-            if branch is not None:
-                if isinstance(branch, int):
-                    description += f' - Case {branch}'
-                else:
-                    description += f' - Branch: {branch.v.name}'
-            return description
+            return self.labels[row]
         if role == qc.Qt.CheckStateRole:
             return qc.Qt.Checked if self.is_selected[row] else qc.Qt.Unchecked
         return qc.QVariant()
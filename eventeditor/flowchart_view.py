@@ -23,6 +23,9 @@ import PyQt5.QtCore as qc # type: ignore
 import PyQt5.QtGui as qg # type: ignore
 import PyQt5.QtWidgets as q # type: ignore
 
+# Event types that have a single next pointer.
+_NEXT_EVENT_TYPES = (ActionEvent, JoinEvent, SubFlowEvent)
+
 class FlowchartWebObject(qc.QObject):
     flowDataChanged = qc.pyqtSignal()
     fileLoaded = qc.pyqtSignal(EventFlow)
@@ -334,18 +337,18 @@ class FlowchartView(q.QWidget):
     def _doAddEventAbove(self, parents: typing.List[typing.Tuple[Event, typing.List[typing.Any]]], event: Event, new_parent: Event) -> None:
         # Update the parents to point to the new parent.
         for parent, branches in parents:
-            if isinstance(parent.data, ActionEvent) or isinstance(parent.data, JoinEvent) or isinstance(parent.data, SubFlowEvent):
+            if isinstance(parent.data, _NEXT_EVENT_TYPES):
                 # Easy case: just set the next pointer to the new parent.
                 parent.data.nxt.v = new_parent
 
             # For switch and fork events, update all branches that currently point to the event.
             elif isinstance(parent.data, SwitchEvent):
                 for case in branches:
-                    if parent.data.cases[case].v == event:
+                    if parent.data.cases[case].v is event:
                         parent.data.cases[case].v = new_parent
             elif isinstance(parent.data, ForkEvent):
                 for i, fork in enumerate(branches):
-                    if fork.v == event:
+                    if fork.v is event:
                         parent.data.forks[i].v = new_parent
 
         # Make the new parent point to the event.
@@ -372,7 +375,7 @@ class FlowchartView(q.QWidget):
             self.webDoAddEventBelow(event, new_event)
 
     def webDoAddEventBelow(self, event: Event, target: Event) -> None:
-        if not (isinstance(event.data, ActionEvent) or isinstance(event.data, SubFlowEvent) or isinstance(event.data, JoinEvent)):
+        if not isinstance(event.data, _NEXT_EVENT_TYPES):
             return
 
         if isinstance(target.data, ActionEvent):
@@ -466,7 +469,7 @@ class FlowchartView(q.QWidget):
         event = self.flow_data.flow.flowchart.events[event_idx]
 
         next_event: typing.Optional[Event] = None
-        if isinstance(event.data, ActionEvent) or isinstance(event.data, JoinEvent) or isinstance(event.data, SubFlowEvent):
+        if isinstance(event.data, _NEXT_EVENT_TYPES):
             next_event = event.data.nxt.v
         elif isinstance(event.data, SwitchEvent):
             next_event = next(iter(event.data.cases.values())).v if event.data.cases else None
@@ -481,22 +484,22 @@ class FlowchartView(q.QWidget):
 
         # Make the parents point to the next event.
         for parent in parents:
-            if isinstance(parent.data, ActionEvent) or isinstance(parent.data, JoinEvent) or isinstance(parent.data, SubFlowEvent):
+            if isinstance(parent.data, _NEXT_EVENT_TYPES):
                 parent.data.nxt.v = next_event
 
             # For switch and fork events, update all branches that currently point to the event.
             # Or remove them if there is no next event.
             elif isinstance(parent.data, SwitchEvent):
-                for case in list(parent.data.cases.keys()):
-                    if parent.data.cases[case].v == event:
-                        if next_event:
-                            parent.data.cases[case].v = next_event
-                        else:
-                            del parent.data.cases[case]
+                matching_cases = [case for case, target in parent.data.cases.items() if target.v is event]
+                for case in matching_cases:
+                    if next_event:
+                        parent.data.cases[case].v = next_event
+                    else:
+                        del parent.data.cases[case]
             elif isinstance(parent.data, ForkEvent):
                 new_forks = []
                 for fork in parent.data.forks:
-                    if fork.v != event:
+                    if fork.v is not event:
                         new_forks.append(fork)
                     elif next_event:
                         ri: RequiredIndex[Event] = RequiredIndex()
@@ -511,7 +514,7 @@ class FlowchartView(q.QWidget):
 
         # Ensure that entry points point to the correct event.
         for entry_point in self.flow_data.flow.flowchart.entry_points:
-            if entry_point.main_event.v == event:
+            if entry_point.main_event.v is event:
                 entry_point.main_event.v = next_event
 
         # Erase this event from the list. None elements will be swept by the caller.
@@ -572,14 +575,14 @@ class FlowchartView(q.QWidget):
         parents: typing.List[typing.Tuple[Event, typing.List[typing.Any]]] = []
         for e in self.flow_data.flow.flowchart.events:
             data = e.data
-            if isinstance(data, ActionEvent) or isinstance(data, JoinEvent) or isinstance(data, SubFlowEvent):
-                if data.nxt.v == event:
+            if isinstance(data, _NEXT_EVENT_TYPES):
+                if data.nxt.v is event:
                     parents.append((e, []))
             elif isinstance(data, SwitchEvent):
-                if any(case.v == event for case in data.cases.values()):
+                if any(case.v is event for case in data.cases.values()):
                     parents.append((e, list(data.cases.keys())))
             elif isinstance(data, ForkEvent):
-                if any(fork.v == event for fork in data.forks):
+                if any(fork.v is event for fork in data.forks):
                     parents.append((e, data.forks))
         return parents
 
@@ -600,7 +603,7 @@ class FlowchartView(q.QWidget):
 
         # Fix entry points.
         for entry_point in self.flow_data.flow.flowchart.entry_points:
-            if entry_point.main_event.v == start:
+            if entry_point.main_event.v is start:
                 entry_point.main_event.v = fork_event
 
         # Add the join event as a child.
@@ -7,24 +7,25 @@ import sys
 from PyQt5 import QtWidgets as qw
 from PyQt5 import QtCore as qc
 import evfl
-
-# Import the timeline editor widget
-from eventeditor.timeline_editor import TimelineEditor
+import eventeditor.util as util
 
 
 class TimelineEditorWindow(qw.QMainWindow):
     """Main window for standalone timeline editor"""
     
+    BASE_TITLE = "EventEditor - Timeline Mode"
+    
     def __init__(self):
         super().__init__()
         self.current_file = None
         self.current_flow = None
         self.timeline_editor = None
+        self._dirty = False
         self.setup_ui()
         
     def setup_ui(self):
         """Initialize the main window UI"""
-        self.setWindowTitle("EventEditor - Timeline Mode")
+        self.update_title()
         self.resize(1200, 700)
         
         # Create menu bar
@@ -93,8 +94,7 @@ class TimelineEditorWindow(qw.QMainWindow):
         try:
             # Load the file
             flow = evfl.EventFlow()
-            with open(filename, 'rb') as f:
-                flow.read(f.read())
+            util.read_flow(filename, flow)
             
             # Check if it has timeline data
             if not flow.timeline:
@@ -124,19 +124,34 @@ class TimelineEditorWindow(qw.QMainWindow):
         """Load timeline data into the editor"""
         # Create timeline editor if it doesn't exist
         if not self.timeline_editor:
+            # Imported here so that starting the window without a file does not
+            # pull in the WebEngine-based editor widget
+            from eventeditor.timeline_editor import TimelineEditor
             self.timeline_editor = TimelineEditor()
             self.timeline_editor.timeline_modified.connect(self.on_timeline_modified)
             self.setCentralWidget(self.timeline_editor)
         
         # Load the timeline data
         self.timeline_editor.load_timeline(timeline)
-        self.setWindowTitle(f"EventEditor - Timeline Mode - {self.current_file}")
+        self._dirty = False
+        self.update_title()
+        
+    def update_title(self):
+        """Rebuild the window title from the current file and dirty flag"""
+        title = self.BASE_TITLE
+        if self.current_file:
+            title += f" - {self.current_file}"
+        if self._dirty:
+            title += " *"
+        self.setWindowTitle(title)
         
     def on_timeline_modified(self):
         """Handle timeline modifications"""
-        # Mark as modified in window title
-        if "*" not in self.windowTitle():
-            self.setWindowTitle(self.windowTitle() + " *")
+        # The title only needs updating on the first modification after a save/load
+        if self._dirty:
+            return
+        self._dirty = True
+        self.update_title()
             
     def save_file(self):
         """Save the current timeline"""
@@ -146,12 +161,10 @@ class TimelineEditorWindow(qw.QMainWindow):
             
         try:
             # Write the flow back to file
-            with open(self.current_file, 'wb') as f:
-                self.current_flow.write(f)
+            util.write_flow(self.current_file, self.current_flow)
             
-            # Remove * from title
-            title = self.windowTitle().replace(" *", "")
-            self.setWindowTitle(title)
+            self._dirty = False
+            self.update_title()
             self.statusBar().showMessage(f"Saved: {self.current_file}")
             qw.QMessageBox.information(self, "Saved", "Timeline saved successfully!")
             
@@ -193,7 +206,7 @@ class TimelineEditorWindow(qw.QMainWindow):
         
     def closeEvent(self, event):
         """Handle window close"""
-        if "*" in self.windowTitle():
+        if self._dirty:
             reply = qw.QMessageBox.question(
                 self,
                 "Unsaved Changes",
@@ -214,6 +227,9 @@ class TimelineEditorWindow(qw.QMainWindow):
 
 def main():
     """Main entry point"""
+    # Lets QtWebEngine be imported after the QApplication is created, so that
+    # it is only loaded with the timeline editor widget
+    qc.QCoreApplication.setAttribute(qc.Qt.AA_ShareOpenGLContexts)
     app = qw.QApplication(sys.argv)
     app.setApplicationName("EventEditor Timeline")
     app.setOrganizationName("cargocult-mods")
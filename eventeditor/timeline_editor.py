@@ -7,8 +7,530 @@ import sys
 from PyQt5 import QtWidgets as qw
 from PyQt5 import QtCore as qc
 from PyQt5 import QtGui as qg
+from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtWebEngineWidgets import QWebEngineView
+import itertools
 import json
+import operator
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Per-clip arrays sent to the timeline page, in the order returned by get_clip_fields()
+_CLIP_ARRAYS = ('names', 'start', 'dur', 'type', 'actor')
+# Clip attributes read by get_clip_fields(), and a getter reading them in one call
+_CLIP_ATTRS = ('name', 'start_time', 'duration', 'type', 'actor_identifier')
+_get_clip_attrs = operator.attrgetter(*_CLIP_ATTRS)
+
+
+def _get_clip_layout(fields):
+    """Track and start time that decide where a clip is placed, from its get_clip_fields() tuple"""
+    name, start, duration, clip_type, actor = fields
+    return actor or clip_type or 'Unnamed', start
+
+
+def _get_max_time(rows):
+    """Length of the time ruler for the given get_clip_fields() tuples"""
+    return max((start + duration for name, start, duration, clip_type, actor in rows), default=0) + 5
+
+# Static page for the timeline view. It is loaded once; clips and zoom are sent through its `tl` API.
+_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+    <style>
+        body {
+            margin: 0;
+            padding: 20px;
+            font-family: Arial, sans-serif;
+            background: #2b2b2b;
+            color: #ffffff;
+            overflow: auto;
+        }
+        canvas {
+            position: fixed;
+            left: 0;
+            top: 0;
+        }
+    </style>
+</head>
+<body>
+    <!-- The canvases only cover the viewport; the empty #timeline div provides the scroll extent -->
+    <canvas id="tl-gl"></canvas>
+    <canvas id="tl-2d"></canvas>
+    <div id="timeline"></div>
+    
+    <script>
+        let timelineData = {names: [], start: [], dur: [], type: [], actor: [], ids: [],
+                            tracks: [], track_offsets: [0], max_time: 0};
+        let pixelsPerSecond = 60;
+        
+        const PAGE_PADDING = 20;
+        const RULER_HEIGHT = 30;
+        const RULER_MARGIN = 10;
+        const TRACK_HEIGHT = 40;
+        const TRACK_GAP = 5;
+        const CLIP_HEIGHT = 35;
+        const MIN_CLIP_WIDTH = 30;
+        const TRACK_COLOR = makeColor('#3a3a3a');
+        const CLIP_COLORS = {
+            camera: makeColor('#4a9eff'),
+            action: makeColor('#5cb85c'),
+            audio: makeColor('#f0ad4e'),
+            event: makeColor('#d9534f'),
+            effect: makeColor('#9b59b6'),
+            default: makeColor('#777777'),
+        };
+        // Floats per rect: x, y, w, h, r, g, b, a
+        const RECT_STRIDE = 8;
+        
+        const container = document.getElementById('timeline');
+        const glCanvas = document.getElementById('tl-gl');
+        const textCanvas = document.getElementById('tl-2d');
+        const ctx = textCanvas.getContext('2d');
+        // Clip and track rects go to WebGL; text, ruler and selection go to the 2D overlay.
+        // If WebGL2 is unavailable, rects are drawn on the overlay instead.
+        const rectRenderer = createRectRenderer(glCanvas.getContext('webgl2'));
+        
+        let width = 0;
+        let height = 0;
+        let maxTime = 0;
+        let tracks = [];
+        // Clips are sorted by track, then by start time. Track t holds the range [trackOffsets[t], trackOffsets[t + 1]).
+        let trackOffsets = [0];
+        // Position in the clip arrays of each clip id
+        let clipPosition = new Int32Array(0);
+        // Clip geometry in CSS pixels, indexed like the clip arrays
+        let clipX = new Float32Array(0);
+        let clipW = new Float32Array(0);
+        let clipY = new Float32Array(0);
+        let clipColor = [];
+        // Widest clip of each track, used to find clips that start before the viewport
+        let trackMaxWidth = new Float32Array(0);
+        let rectData = new Float32Array(0);
+        // CSS colour of each rect, used when drawing rects on the overlay
+        let rectStyles = [];
+        let rectCount = 0;
+        let visibleClips = new Int32Array(0);
+        let visibleCount = 0;
+        // Visible area in timeline coordinates
+        let viewX = 0;
+        let viewY = 0;
+        let viewWidth = 0;
+        let viewHeight = 0;
+        let dpr = 1;
+        let selectedIndex = -1;
+        let drawPending = false;
+        // Whether the next frame must rebuild and re-upload the rect layer
+        let rectsDirty = true;
+        
+        // Colours are kept both as a CSS string and as normalized RGBA for the rect buffer
+        function makeColor(hex) {
+            const v = parseInt(hex.slice(1), 16);
+            return {css: hex, rgba: [(v >> 16 & 255) / 255, (v >> 8 & 255) / 255, (v & 255) / 255, 1]};
+        }
+        
+        function createRectRenderer(gl) {
+            if (!gl) {
+                return null;
+            }
+            
+            // Each rect is one instance; the six quad corners come from gl_VertexID.
+            const vertexSource = `#version 300 es
+                in vec4 aRect;
+                in vec4 aColor;
+                uniform vec4 uScreenTransform;
+                out vec4 vColor;
+                const vec2 CORNERS[6] = vec2[6](vec2(0, 0), vec2(1, 0), vec2(0, 1),
+                                                vec2(0, 1), vec2(1, 0), vec2(1, 1));
+                void main() {
+                    vec2 pos = aRect.xy + CORNERS[gl_VertexID] * aRect.zw;
+                    gl_Position = vec4(pos * uScreenTransform.xy + uScreenTransform.zw, 0.0, 1.0);
+                    vColor = aColor;
+                }`;
+            const fragmentSource = `#version 300 es
+                precision mediump float;
+                in vec4 vColor;
+                out vec4 outColor;
+                void main() {
+                    outColor = vColor;
+                }`;
+            
+            function compile(type, source) {
+                const shader = gl.createShader(type);
+                gl.shaderSource(shader, source);
+                gl.compileShader(shader);
+                return gl.getShaderParameter(shader, gl.COMPILE_STATUS) ? shader : null;
+            }
+            const vs = compile(gl.VERTEX_SHADER, vertexSource);
+            const fs = compile(gl.FRAGMENT_SHADER, fragmentSource);
+            if (!vs || !fs) {
+                return null;
+            }
+            const program = gl.createProgram();
+            gl.attachShader(program, vs);
+            gl.attachShader(program, fs);
+            gl.linkProgram(program);
+            if (!gl.getProgramParameter(program, gl.LINK_STATUS)) {
+                return null;
+            }
+            
+            const vao = gl.createVertexArray();
+            const buffer = gl.createBuffer();
+            gl.bindVertexArray(vao);
+            gl.bindBuffer(gl.ARRAY_BUFFER, buffer);
+            const rectLoc = gl.getAttribLocation(program, 'aRect');
+            const colorLoc = gl.getAttribLocation(program, 'aColor');
+            gl.enableVertexAttribArray(rectLoc);
+            gl.vertexAttribPointer(rectLoc, 4, gl.FLOAT, false, RECT_STRIDE * 4, 0);
+            gl.vertexAttribDivisor(rectLoc, 1);
+            gl.enableVertexAttribArray(colorLoc);
+            gl.vertexAttribPointer(colorLoc, 4, gl.FLOAT, false, RECT_STRIDE * 4, 16);
+            gl.vertexAttribDivisor(colorLoc, 1);
+            gl.bindVertexArray(null);
+            const transformLoc = gl.getUniformLocation(program, 'uScreenTransform');
+            
+            return {
+                resize(w, h, dpr) {
+                    glCanvas.width = w * dpr;
+                    glCanvas.height = h * dpr;
+                    glCanvas.style.width = w + 'px';
+                    glCanvas.style.height = h + 'px';
+                },
+                draw(data, count) {
+                    gl.viewport(0, 0, glCanvas.width, glCanvas.height);
+                    gl.clearColor(0, 0, 0, 0);
+                    gl.clear(gl.COLOR_BUFFER_BIT);
+                    if (!count) {
+                        return;
+                    }
+                    gl.useProgram(program);
+                    gl.uniform4f(transformLoc, 2 / viewWidth, -2 / viewHeight,
+                                 -1 - 2 * viewX / viewWidth, 1 + 2 * viewY / viewHeight);
+                    gl.bindBuffer(gl.ARRAY_BUFFER, buffer);
+                    gl.bufferData(gl.ARRAY_BUFFER, data.subarray(0, count * RECT_STRIDE), gl.DYNAMIC_DRAW);
+                    gl.bindVertexArray(vao);
+                    gl.drawArraysInstanced(gl.TRIANGLES, 0, 6, count);
+                    gl.bindVertexArray(null);
+                },
+            };
+        }
+        
+        function trackTop(trackIndex) {
+            return RULER_HEIGHT + RULER_MARGIN + trackIndex * (TRACK_HEIGHT + TRACK_GAP);
+        }
+        
+        function layoutTimeline() {
+            const data = timelineData;
+            const count = data.ids.length;
+            tracks = data.tracks;
+            trackOffsets = data.track_offsets;
+            
+            clipPosition = new Int32Array(count);
+            data.ids.forEach((id, i) => {
+                clipPosition[id] = i;
+            });
+            clipX = new Float32Array(count);
+            clipW = new Float32Array(count);
+            clipY = new Float32Array(count);
+            clipColor = data.type.map(type => CLIP_COLORS[(type || 'default').toLowerCase()] || CLIP_COLORS.default);
+            trackMaxWidth = new Float32Array(tracks.length);
+            for (let t = 0; t < tracks.length; t++) {
+                const y = trackTop(t) + (TRACK_HEIGHT - CLIP_HEIGHT) / 2;
+                for (let i = trackOffsets[t]; i < trackOffsets[t + 1]; i++) {
+                    clipX[i] = data.start[i] * pixelsPerSecond;
+                    clipW[i] = Math.max(data.dur[i] * pixelsPerSecond, MIN_CLIP_WIDTH);
+                    clipY[i] = y;
+                    trackMaxWidth[t] = Math.max(trackMaxWidth[t], clipW[i]);
+                }
+            }
+            rectData = new Float32Array((tracks.length + count + 1) * RECT_STRIDE);
+            visibleClips = new Int32Array(count);
+            
+            maxTime = data.max_time;
+            width = Math.ceil(maxTime * pixelsPerSecond) + MIN_CLIP_WIDTH;
+            height = trackTop(tracks.length);
+            container.style.width = width + 'px';
+            container.style.height = height + 'px';
+        }
+        
+        function resizeView() {
+            dpr = window.devicePixelRatio || 1;
+            viewWidth = document.documentElement.clientWidth;
+            viewHeight = document.documentElement.clientHeight;
+            textCanvas.width = viewWidth * dpr;
+            textCanvas.height = viewHeight * dpr;
+            textCanvas.style.width = viewWidth + 'px';
+            textCanvas.style.height = viewHeight + 'px';
+            if (rectRenderer) {
+                rectRenderer.resize(viewWidth, viewHeight, dpr);
+            }
+        }
+        
+        function updateViewOrigin() {
+            viewX = window.scrollX - PAGE_PADDING;
+            viewY = window.scrollY - PAGE_PADDING;
+        }
+        
+        // Index of the first clip of track t whose left edge is at or after x
+        function lowerBound(t, x) {
+            let lo = trackOffsets[t], hi = trackOffsets[t + 1];
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (clipX[mid] < x) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+            return lo;
+        }
+        
+        function firstVisibleTrack() {
+            return Math.max(0, Math.floor((viewY - trackTop(0)) / (TRACK_HEIGHT + TRACK_GAP)));
+        }
+        
+        function lastVisibleTrack() {
+            return Math.min(tracks.length - 1,
+                            Math.floor((viewY + viewHeight - trackTop(0)) / (TRACK_HEIGHT + TRACK_GAP)));
+        }
+        
+        // Overlay-only changes (such as the selection) pass false to keep the rect layer as is
+        function requestDraw(rectsChanged = true) {
+            rectsDirty = rectsDirty || rectsChanged;
+            if (!drawPending) {
+                drawPending = true;
+                requestAnimationFrame(draw);
+            }
+        }
+        
+        function pushRect(x, y, w, h, color) {
+            const o = rectCount * RECT_STRIDE;
+            const rgba = color.rgba;
+            rectData[o] = x;
+            rectData[o + 1] = y;
+            rectData[o + 2] = w;
+            rectData[o + 3] = h;
+            rectData[o + 4] = rgba[0];
+            rectData[o + 5] = rgba[1];
+            rectData[o + 6] = rgba[2];
+            rectData[o + 7] = rgba[3];
+            rectStyles[rectCount] = color.css;
+            rectCount++;
+        }
+        
+        // Collect the rects of the tracks and clips inside the viewport
+        function buildRects() {
+            const left = Math.max(0, viewX);
+            const right = Math.min(width, viewX + viewWidth);
+            rectCount = 0;
+            visibleCount = 0;
+            for (let t = firstVisibleTrack(); t <= lastVisibleTrack(); t++) {
+                pushRect(left, trackTop(t), right - left, TRACK_HEIGHT, TRACK_COLOR);
+                const end = trackOffsets[t + 1];
+                for (let i = lowerBound(t, viewX - trackMaxWidth[t]); i < end; i++) {
+                    if (clipX[i] >= right) {
+                        break;
+                    }
+                    if (clipX[i] + clipW[i] <= viewX) {
+                        continue;
+                    }
+                    pushRect(clipX[i], clipY[i], clipW[i], CLIP_HEIGHT, clipColor[i]);
+                    visibleClips[visibleCount++] = i;
+                }
+            }
+        }
+        
+        function drawRects2D() {
+            for (let r = 0; r < rectCount; r++) {
+                const o = r * RECT_STRIDE;
+                ctx.fillStyle = rectStyles[r];
+                ctx.fillRect(rectData[o], rectData[o + 1], rectData[o + 2], rectData[o + 3]);
+            }
+        }
+        
+        function draw() {
+            drawPending = false;
+            if (rectsDirty) {
+                rectsDirty = false;
+                updateViewOrigin();
+                buildRects();
+                if (rectRenderer) {
+                    rectRenderer.draw(rectData, rectCount);
+                }
+            }
+            
+            ctx.setTransform(dpr, 0, 0, dpr, -viewX * dpr, -viewY * dpr);
+            ctx.clearRect(viewX, viewY, viewWidth, viewHeight);
+            if (!rectRenderer) {
+                drawRects2D();
+            }
+            
+            drawTimeRuler();
+            
+            ctx.textBaseline = 'top';
+            for (let v = 0; v < visibleCount; v++) {
+                drawClipLabel(visibleClips[v]);
+            }
+            ctx.font = 'bold 12px Arial, sans-serif';
+            ctx.fillStyle = '#aaa';
+            for (let t = firstVisibleTrack(); t <= lastVisibleTrack(); t++) {
+                ctx.fillText(tracks[t], 10, trackTop(t) + 10);
+            }
+            
+            if (selectedIndex >= 0) {
+                ctx.strokeStyle = '#4a9eff';
+                ctx.lineWidth = 2;
+                ctx.strokeRect(clipX[selectedIndex] + 1, clipY[selectedIndex] + 1,
+                               clipW[selectedIndex] - 2, CLIP_HEIGHT - 2);
+            }
+        }
+        
+        function drawClipLabel(i) {
+            const x = clipX[i], y = clipY[i], w = clipW[i];
+            ctx.save();
+            ctx.beginPath();
+            ctx.rect(x, y, w, CLIP_HEIGHT);
+            ctx.clip();
+            ctx.font = '11px Arial, sans-serif';
+            ctx.fillStyle = '#fff';
+            ctx.fillText(timelineData.names[i], x + 7, y + 7);
+            ctx.restore();
+        }
+        
+        function drawTimeRuler() {
+            if (viewY >= RULER_HEIGHT) {
+                return;
+            }
+            const left = Math.max(0, viewX);
+            const right = Math.min(width, viewX + viewWidth);
+            ctx.fillStyle = '#1a1a1a';
+            ctx.fillRect(left, 0, right - left, RULER_HEIGHT);
+            ctx.fillStyle = '#555';
+            ctx.fillRect(left, RULER_HEIGHT - 1, right - left, 1);
+            
+            const majorInterval = 5;  // Major markers every 5 seconds
+            const minorInterval = 1;  // Minor markers every 1 second
+            
+            // Start one major interval early so that labels of partially visible markers are drawn
+            const firstTime = Math.max(0, Math.floor(viewX / pixelsPerSecond / majorInterval - 1) * majorInterval);
+            const lastTime = Math.min(maxTime, right / pixelsPerSecond);
+            ctx.font = '10px Arial, sans-serif';
+            ctx.textBaseline = 'bottom';
+            for (let t = firstTime; t <= lastTime; t += minorInterval) {
+                const x = t * pixelsPerSecond;
+                const isMajor = t % majorInterval === 0;
+                const lineHeight = isMajor ? 20 : 10;
+                ctx.fillStyle = '#555';
+                ctx.fillRect(x, RULER_HEIGHT - lineHeight, 1, lineHeight);
+                if (isMajor) {
+                    ctx.fillStyle = '#888';
+                    ctx.fillText(t + 's', x + 5, RULER_HEIGHT);
+                }
+            }
+        }
+        
+        function hitTest(x, y) {
+            const t = Math.floor((y - trackTop(0)) / (TRACK_HEIGHT + TRACK_GAP));
+            if (t < 0 || t >= tracks.length || y - trackTop(t) > TRACK_HEIGHT) {
+                return -1;
+            }
+            // Skip the clips that start after x, then search backwards since later clips are drawn on top
+            let end = lowerBound(t, x);
+            while (end < trackOffsets[t + 1] && clipX[end] <= x) {
+                end++;
+            }
+            for (let i = end - 1; i >= trackOffsets[t]; i--) {
+                if (clipX[i] + trackMaxWidth[t] <= x) {
+                    break;
+                }
+                if (x < clipX[i] + clipW[i] && y >= clipY[i] && y < clipY[i] + CLIP_HEIGHT) {
+                    return i;
+                }
+            }
+            return -1;
+        }
+        
+        function selectClip(i) {
+            selectedIndex = i;
+            requestDraw(false);
+            
+            // Notify Python side
+            if (window.pyBridge) {
+                window.pyBridge.clipSelected(timelineData.ids[i]);
+            }
+        }
+        
+        textCanvas.addEventListener('click', e => {
+            updateViewOrigin();
+            const i = hitTest(e.clientX + viewX, e.clientY + viewY);
+            if (i >= 0) {
+                selectClip(i);
+            }
+        });
+        window.addEventListener('scroll', () => requestDraw());
+        window.addEventListener('resize', () => {
+            resizeView();
+            requestDraw();
+        });
+        
+        // Update API used by the Python side instead of reloading the page
+        window.tl = {
+            setData(data, selected) {
+                timelineData = data;
+                layoutTimeline();
+                selectedIndex = selected >= 0 ? clipPosition[selected] : -1;
+                requestDraw();
+            },
+            updateClip(id, fields, maxTime) {
+                const i = clipPosition[id];
+                for (const key in fields) {
+                    timelineData[key][i] = fields[key];
+                }
+                timelineData.max_time = maxTime;
+                layoutTimeline();
+                requestDraw();
+            },
+            setZoom(pps) {
+                pixelsPerSecond = pps;
+                layoutTimeline();
+                requestDraw();
+            },
+        };
+        
+        // Initial render
+        resizeView();
+        layoutTimeline();
+        requestDraw();
+        
+        // Set up the bridge last so that the timeline is drawn even if qwebchannel.js failed to load
+        if (window.qt && typeof QWebChannel !== 'undefined') {
+            new QWebChannel(qt.webChannelTransport, channel => {
+                window.pyBridge = channel.objects.pyBridge;
+            });
+        }
+    </script>
+</body>
+</html>
+"""
+
+class TimelineWebObject(qc.QObject):
+    """Object exposed to the timeline page as `pyBridge` through QWebChannel"""
+    
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        
+    @qc.pyqtSlot(int)
+    def clipSelected(self, clip_id):
+        self.editor.on_clip_selected(clip_id)
+
 
 class TimelineEditor(qw.QWidget):
     """Main timeline editor widget"""
@@ -20,7 +542,18 @@ class TimelineEditor(qw.QWidget):
         super().__init__(parent)
         self.timeline = None
         self.selected_clip = None
+        self.selected_index = -1
+        self.clip_layout = []  # _get_clip_layout() of each clip, as last sent to the page
         self.zoom_level = 1.0  # pixels per second
+        # Updates waiting to be sent to the page by _do_render
+        self._page_ready = False
+        self._zoom_pending = False
+        self._data_pending = False
+        self._pending_clips = set()
+        self._render_timer = qc.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)
+        self._render_timer.timeout.connect(self._do_render)
         self.setup_ui()
         
     def setup_ui(self):
@@ -36,6 +569,13 @@ class TimelineEditor(qw.QWidget):
         
         # Timeline view (WebEngine for rendering)
         self.timeline_view = QWebEngineView()
+        self.web_object = TimelineWebObject(self)
+        self.channel = QWebChannel()
+        self.channel.registerObject('pyBridge', self.web_object)
+        self.timeline_view.page().setWebChannel(self.channel)
+        self.timeline_view.loadFinished.connect(self.on_page_loaded)
+        # A qrc base URL lets the page load qwebchannel.js from Qt's resources
+        self.timeline_view.setHtml(_TEMPLATE, qc.QUrl('qrc:///'))
         splitter.addWidget(self.timeline_view)
         
         # Properties panel
@@ -89,285 +629,139 @@ class TimelineEditor(qw.QWidget):
     def load_timeline(self, timeline):
         """Load timeline data and render it"""
         self.timeline = timeline
-        self.render_timeline()
-        
-    def render_timeline(self):
-        """Render the timeline view"""
+        self.selected_clip = None
+        self.selected_index = -1
+        self.properties_panel.clear()
+        # Zoom changes made without a timeline were not sent, so send the whole state
+        self._zoom_pending = True
+        self.refresh_timeline_data()
+        
+    def on_page_loaded(self, ok):
+        """Send the updates queued while the page was loading"""
+        self._page_ready = ok
+        if ok:
+            self.schedule_render()
+        
+    def run_timeline_js(self, function, *args):
+        """Call a function of the page's `tl` API to update it in place"""
         if not self.timeline:
             return
-            
-        # Generate HTML/JS for timeline visualization
-        html = self.generate_timeline_html()
-        self.timeline_view.setHtml(html)
-        
-        # Set up JavaScript bridge for interaction
-        self.setup_js_bridge()
+        js_args = ', '.join(_dumps(arg) for arg in args)
+        self.timeline_view.page().runJavaScript(f"tl.{function}({js_args})")
         
-    def generate_timeline_html(self):
-        """Generate HTML for timeline visualization"""
-        # Prepare timeline data for JavaScript
-        timeline_data = self.prepare_timeline_data()
-        
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            margin: 0;
-            padding: 20px;
-            font-family: Arial, sans-serif;
-            background: #2b2b2b;
-            color: #ffffff;
-            overflow-x: auto;
-        }}
-        #timeline-container {{
-            position: relative;
-            min-height: 500px;
-        }}
-        .track {{
-            position: relative;
-            height: 40px;
-            margin-bottom: 5px;
-            background: #3a3a3a;
-            border-radius: 3px;
-        }}
-        .track-label {{
-            position: absolute;
-            left: 10px;
-            top: 10px;
-            font-weight: bold;
-            font-size: 12px;
-            color: #aaa;
-            z-index: 10;
-        }}
-        .clip {{
-            position: absolute;
-            height: 35px;
-            top: 2.5px;
-            border-radius: 3px;
-            cursor: pointer;
-            border: 2px solid transparent;
-            transition: border-color 0.2s;
-            overflow: hidden;
-        }}
-        .clip:hover {{
-            border-color: #fff;
-        }}
-        .clip.selected {{
-            border-color: #4a9eff;
-            box-shadow: 0 0 10px #4a9eff;
-        }}
-        .clip-label {{
-            padding: 5px;
-            font-size: 11px;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }}
-        .time-ruler {{
-            height: 30px;
-            background: #1a1a1a;
-            border-bottom: 1px solid #555;
-            position: relative;
-            margin-bottom: 10px;
-        }}
-        .time-marker {{
-            position: absolute;
-            bottom: 0;
-            font-size: 10px;
-            color: #888;
-        }}
-        .time-line {{
-            position: absolute;
-            bottom: 0;
-            width: 1px;
-            height: 10px;
-            background: #555;
-        }}
-        /* Clip type colors */
-        .clip-type-camera {{ background: #4a9eff; }}
-        .clip-type-action {{ background: #5cb85c; }}
-        .clip-type-audio {{ background: #f0ad4e; }}
-        .clip-type-event {{ background: #d9534f; }}
-        .clip-type-effect {{ background: #9b59b6; }}
-        .clip-type-default {{ background: #777; }}
-    </style>
-</head>
-<body>
-    <div class="time-ruler" id="time-ruler"></div>
-    <div id="timeline-container"></div>
-    
-    <script>
-        const timelineData = {json.dumps(timeline_data)};
-        const pixelsPerSecond = {self.zoom_level * 60};
-        let selectedClip = null;
-        
-        function renderTimeline() {{
-            const container = document.getElementById('timeline-container');
-            container.innerHTML = '';
-            
-            // Group clips by actor/track
-            const tracks = groupClipsByTrack(timelineData.clips);
-            
-            // Render each track
-            Object.keys(tracks).forEach(trackName => {{
-                const track = createTrack(trackName, tracks[trackName]);
-                container.appendChild(track);
-            }});
-            
-            // Render time ruler
-            renderTimeRuler();
-        }}
-        
-        function groupClipsByTrack(clips) {{
-            const tracks = {{}};
-            clips.forEach(clip => {{
-                const trackName = clip.actor || clip.type || 'Unnamed';
-                if (!tracks[trackName]) {{
-                    tracks[trackName] = [];
-                }}
-                tracks[trackName].push(clip);
-            }});
-            return tracks;
-        }}
-        
-        function createTrack(name, clips) {{
-            const track = document.createElement('div');
-            track.className = 'track';
-            
-            const label = document.createElement('div');
-            label.className = 'track-label';
-            label.textContent = name;
-            track.appendChild(label);
-            
-            clips.forEach(clip => {{
-                const clipEl = createClip(clip);
-                track.appendChild(clipEl);
-            }});
-            
-            return track;
-        }}
-        
-        function createClip(clip) {{
-            const clipEl = document.createElement('div');
-            clipEl.className = 'clip clip-type-' + (clip.type || 'default').toLowerCase();
-            clipEl.dataset.clipId = clip.id;
-            
-            const startPx = clip.start_time * pixelsPerSecond;
-            const widthPx = clip.duration * pixelsPerSecond;
-            
-            clipEl.style.left = startPx + 'px';
-            clipEl.style.width = Math.max(widthPx, 30) + 'px';  // Minimum 30px width
-            
-            const label = document.createElement('div');
-            label.className = 'clip-label';
-            label.textContent = clip.name;
-            clipEl.appendChild(label);
-            
-            clipEl.onclick = () => selectClip(clip);
-            
-            return clipEl;
-        }}
-        
-        function selectClip(clip) {{
-            // Remove previous selection
-            if (selectedClip) {{
-                document.querySelectorAll('.clip').forEach(el => {{
-                    el.classList.remove('selected');
-                }});
-            }}
-            
-            // Add new selection
-            selectedClip = clip;
-            const clipEl = document.querySelector(`[data-clip-id="${{clip.id}}"]`);
-            if (clipEl) {{
-                clipEl.classList.add('selected');
-            }}
-            
-            // Notify Python side
-            window.pyBridge.clipSelected(JSON.stringify(clip));
-        }}
-        
-        function renderTimeRuler() {{
-            const ruler = document.getElementById('time-ruler');
-            ruler.innerHTML = '';
-            
-            const maxTime = Math.max(...timelineData.clips.map(c => c.start_time + c.duration)) + 5;
-            const majorInterval = 5;  // Major markers every 5 seconds
-            const minorInterval = 1;  // Minor markers every 1 second
-            
-            for (let t = 0; t <= maxTime; t += minorInterval) {{
-                const marker = document.createElement('div');
-                marker.className = 'time-line';
-                marker.style.left = (t * pixelsPerSecond) + 'px';
-                
-                if (t % majorInterval === 0) {{
-                    marker.style.height = '20px';
-                    const label = document.createElement('div');
-                    label.className = 'time-marker';
-                    label.style.left = (t * pixelsPerSecond + 5) + 'px';
-                    label.textContent = t + 's';
-                    ruler.appendChild(label);
-                }}
-                
-                ruler.appendChild(marker);
-            }}
-        }}
-        
-        // Initial render
-        renderTimeline();
-    </script>
-</body>
-</html>
-        """
-        
-        return html
+    def refresh_timeline_data(self):
+        """Send the full clip list to the page on the next render"""
+        self._data_pending = True
+        self.schedule_render()
         
     def prepare_timeline_data(self):
-        """Convert timeline data to JSON-serializable format"""
-        if not self.timeline:
-            return {'clips': []}
-            
-        clips_data = []
-        
+        """Convert timeline data to JSON-serializable parallel arrays (one entry per clip)"""
         # Access clips from timeline
-        clips = getattr(self.timeline, 'clips', [])
-        
-        for i, clip in enumerate(clips):
-            clip_dict = {
-                'id': i,
-                'name': getattr(clip, 'name', f'Clip_{i}'),
-                'start_time': getattr(clip, 'start_time', 0.0),
-                'duration': getattr(clip, 'duration', 1.0),
-                'type': getattr(clip, 'type', 'action'),
-                'actor': getattr(clip, 'actor_identifier', None),
-            }
-            clips_data.append(clip_dict)
+        clips = getattr(self.timeline, 'clips', []) if self.timeline else []
+        
+        get_fields = self.get_clip_reader(clips)
+        rows = [get_fields(i, clip) for i, clip in enumerate(clips)]
+        self.clip_layout = [_get_clip_layout(fields) for fields in rows]
+        # Tracks are numbered in order of first appearance
+        track_numbers = {}
+        for track, start in self.clip_layout:
+            track_numbers.setdefault(track, len(track_numbers))
             
-        return {'clips': clips_data}
-        
-    def setup_js_bridge(self):
-        """Setup JavaScript <-> Python bridge for interaction"""
-        # This would use QWebChannel in a full implementation
-        # For now, we'll handle it through URL schemes or other methods
-        pass
+        # Clips are sent sorted by track then start time, so that each track is a contiguous
+        # range of the arrays that the page can bisect. `ids` maps positions back to clips.
+        layout = self.clip_layout
+        order = sorted(range(len(rows)), key=lambda i: (track_numbers[layout[i][0]], layout[i][1]))
+        columns = zip(*(rows[i] for i in order)) if rows else [()] * len(_CLIP_ARRAYS)
+        data = {key: list(column) for key, column in zip(_CLIP_ARRAYS, columns)}
+        data['ids'] = order
+        
+        track_sizes = [0] * len(track_numbers)
+        for track, start in layout:
+            track_sizes[track_numbers[track]] += 1
+        data['tracks'] = list(track_numbers)
+        data['track_offsets'] = [0] + list(itertools.accumulate(track_sizes))
+        data['max_time'] = _get_max_time(rows)
+        return data
+        
+    def get_clip_reader(self, clips):
+        """Pick the function used to read the fields of every clip in a list"""
+        # Decided once per list rather than per clip: evfl clips lack some of the fields,
+        # and a failed attrgetter call costs more than the getattr defaults
+        if clips and all(hasattr(clips[0], attr) for attr in _CLIP_ATTRS):
+            return self.get_clip_fields_fast
+        return self.get_clip_fields
+        
+    def get_clip_fields_fast(self, i, clip):
+        """get_clip_fields() for clips that define all of the displayed fields"""
+        try:
+            return _get_clip_attrs(clip)
+        except AttributeError:
+            return self.get_clip_fields(i, clip)
+        
+    def get_clip_fields(self, i, clip):
+        """Read the displayed fields of a clip, in _CLIP_ARRAYS order"""
+        return (
+            getattr(clip, 'name', f'Clip_{i}'),
+            getattr(clip, 'start_time', 0.0),
+            getattr(clip, 'duration', 1.0),
+            getattr(clip, 'type', 'action'),
+            getattr(clip, 'actor_identifier', None),
+        )
         
-    def on_clip_selected(self, clip_data):
+    def on_clip_selected(self, clip_id):
         """Handle clip selection from timeline view"""
         # Find the actual clip object
         clips = getattr(self.timeline, 'clips', [])
-        clip_id = clip_data.get('id', -1)
-        
         if 0 <= clip_id < len(clips):
             self.selected_clip = clips[clip_id]
+            self.selected_index = clip_id
             self.properties_panel.load_clip(self.selected_clip)
             
     def on_clip_modified(self):
         """Handle clip modification from properties panel"""
         self.timeline_modified.emit()
-        self.render_timeline()  # Re-render to show changes
+        if self.selected_index >= 0:
+            # Only the selected clip can be edited, so only it needs to be sent
+            self._pending_clips.add(self.selected_index)
+            self.schedule_render()
+            
+    def schedule_render(self):
+        """Send pending updates to the page on the next timer tick"""
+        # The panel and the zoom actions can fire many times per frame, so coalesce them
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+            
+    def _do_render(self):
+        """Send the updates queued since the last render to the page"""
+        if not self._page_ready:
+            # on_page_loaded renders again once the page can receive updates
+            return
+        if self._zoom_pending:
+            self._zoom_pending = False
+            self.run_timeline_js('setZoom', self.zoom_level * 60)
+        clips = getattr(self.timeline, 'clips', [])
+        updates = []
+        if not self._data_pending:
+            for i in self._pending_clips:
+                if i >= len(clips):
+                    continue
+                fields = self.get_clip_fields(i, clips[i])
+                if _get_clip_layout(fields) != self.clip_layout[i]:
+                    # The clip moved in time or to another track, which can change the clip order
+                    self._data_pending = True
+                    break
+                updates.append((i, fields))
+        self._pending_clips.clear()
+        if self._data_pending:
+            self._data_pending = False
+            self.run_timeline_js('setData', self.prepare_timeline_data(), self.selected_index)
+            return
+        if not updates:
+            return
+        get_fields = self.get_clip_reader(clips)
+        max_time = _get_max_time(get_fields(i, clip) for i, clip in enumerate(clips))
+        for i, fields in updates:
+            self.run_timeline_js('updateClip', i, dict(zip(_CLIP_ARRAYS, fields)), max_time)
         
     def add_clip(self):
         """Add a new clip to the timeline"""
@@ -375,7 +769,7 @@ class TimelineEditor(qw.QWidget):
         if dialog.exec_() == qw.QDialog.Accepted:
             # Clip was added to timeline in dialog
             self.timeline_modified.emit()
-            self.render_timeline()
+            self.refresh_timeline_data()
             
     def delete_selected_clip(self):
         """Delete the currently selected clip"""
@@ -393,22 +787,26 @@ class TimelineEditor(qw.QWidget):
         if reply == qw.QMessageBox.Yes:
             # Remove from timeline
             clips = getattr(self.timeline, 'clips', [])
-            if self.selected_clip in clips:
-                clips.remove(self.selected_clip)
+            index = self.selected_index
+            if 0 <= index < len(clips) and clips[index] is self.selected_clip:
+                del clips[index]
                 self.selected_clip = None
+                self.selected_index = -1
                 self.properties_panel.clear()
                 self.timeline_modified.emit()
-                self.render_timeline()
+                self.refresh_timeline_data()
                 
     def zoom_in(self):
         """Increase zoom level"""
         self.zoom_level = min(self.zoom_level * 1.5, 10.0)
-        self.render_timeline()
+        self._zoom_pending = True
+        self.schedule_render()
         
     def zoom_out(self):
         """Decrease zoom level"""
         self.zoom_level = max(self.zoom_level / 1.5, 0.1)
-        self.render_timeline()
+        self._zoom_pending = True
+        self.schedule_render()
 
 
 class TimelinePropertiesPanel(qw.QWidget):
@@ -507,6 +905,7 @@ class TimelinePropertiesPanel(qw.QWidget):
         
     def clear(self):
         """Clear the form"""
+        self.current_clip = None
         self.name_edit.clear()
         self.start_spin.setValue(0.0)
         self.duration_spin.setValue(1.0)
@@ -18,14 +18,13 @@ def read_flow(path: str, flow: evfl.evfl.EventFlow):
 
 def write_flow(path: str, flow: evfl.evfl.EventFlow):
     try:
-        if path.endswith('.gz'):
-            buf = io.BytesIO()
-            flow.write(buf)
-            with gzip.open(path + '.tmp', 'wb') as f:
-                f.write(buf.getbuffer())
-        else:
-            with open(path + '.tmp', 'wb') as f:
-                flow.write(f)
+        # Serialize in memory first: evfl issues many small writes and seeks,
+        # which are much cheaper on a BytesIO than on a real file.
+        buf = io.BytesIO()
+        flow.write(buf)
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path + '.tmp', 'wb') as f:
+            f.write(buf.getbuffer())
         os.replace(path + '.tmp', path)
     except:
         try: